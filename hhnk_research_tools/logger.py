@@ -5,31 +5,60 @@ This is applied by default in the __init__ of hhnk_research_tools. So when it is
 in a project, the logging will be set according to these rules.
 """
 
+import atexit
+import copy
+import functools
 import logging
+import os
+import re
 import sys
+import threading
+import weakref
 
 # from logging import *  # noqa: F401,F403 # type: ignore
-from logging.handlers import RotatingFileHandler
+from logging import config as logging_config
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from pathlib import Path
 from typing import Union
 
-LOGFORMAT = "%(asctime)s|%(levelname)-8s| %(name)s:%(lineno)-4d| %(message)s"  # default logformat
+LOGFORMAT = "%(asctime)s|%(levelname)s| %(name)s:%(lineno)-4d| %(message)s"  # default logformat
 DATEFMT_STREAM = "%H:%M:%S"  # default dateformat for console logger
 DATEFMT_FILE = "%Y-%m-%d %H:%M:%S"  # default dateformat for file logger
 
+# Levelnames padded to the previous "%(levelname)-8s" width, computed once instead
+# of running the %-style width logic on every record.
+_LEVEL_PAD = {name: f"{name:<8}" for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL", "NOTSET")}
 
-def get_logconfig_dict(level_root="WARNING", level_dict=None, log_filepath=None):
-    """Make a dict for the logging.
 
-    Parameters
-    ----------
-    level_root : str
-        Default log level, warnings are printed to console.
-    level_dict : dict[level:list]
-        e.g. {"INFO" : ['hhnk_research_tools','hhnk_threedi_tools']}
-        Apply a different loglevel for these packages.
-    log_filepath : str
-        Option to write a log_filepath.
+class FastFormatter(logging.Formatter):
+    """Formatter that pads the levelname from a precomputed table."""
+
+    def format(self, record):
+        levelname = record.levelname
+        record.levelname = _LEVEL_PAD.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            # The record is shared with the other handlers; restore the
+            # unpadded name so their formatters see the original.
+            record.levelname = levelname
+
+# Rename long packagenames with shorter ones in loggernames, e.g. "hhnk_research_tools" -> "hrt".
+# Precompiled so get_logger does a single pass over the name.
+_NAME_MAP = {
+    "hhnk_research_tools": "hrt",
+    "hhnk_threedi_tools": "htt",
+}
+_NAME_PATTERN = re.compile("|".join(_NAME_MAP))
+
+
+@functools.lru_cache(maxsize=32)
+def _build_logconfig_dict_cached(level_root, level_items, log_filepath):
+    """Build the logconfig dict, cached on its (hashable) arguments.
+
+    The same few configurations are requested over and over (import time and
+    whenever logging is retuned), so the nested dict only has to be built once
+    per combination. Callers get a deepcopy via get_logconfig_dict.
     """
     logconfig_dict = {
         "version": 1,
@@ -59,6 +88,7 @@ def get_logconfig_dict(level_root="WARNING", level_dict=None, log_filepath=None)
         },
         "formatters": {
             "time_level_name": {
+                "()": FastFormatter,
                 "format": LOGFORMAT,
                 # "format": "%(asctime)s|%(levelname)-8s| %(name)s-%(process)d::%(module)s|%(lineno)-4s: %(message)s",
                 "datefmt": DATEFMT_STREAM,
@@ -67,18 +97,13 @@ def get_logconfig_dict(level_root="WARNING", level_dict=None, log_filepath=None)
         },
     }
 
-    # Apply a different loglevel for these packages.
-    if level_dict:
-        for loglevel, level_list in level_dict.items():
-            if not isinstance(level_list, list):
-                raise TypeError("Level_dict should provide lists.")
-
-            for pkg in level_list:
-                logconfig_dict["loggers"][pkg] = {
-                    "level": loglevel,
-                    # "propagate": False, # This will stop the logger from propagating to the root logger
-                    # "handlers": ["debug_console_handler"], # When propagate is False, this is needed
-                }
+    # Apply a different loglevel for these packages. Built as a single comprehension
+    # so the container is allocated in one go.
+    # Options per package: "propagate": False stops the logger from propagating to the
+    # root logger, which then needs "handlers": ["debug_console_handler"].
+    logconfig_dict["loggers"].update(
+        {pkg: {"level": loglevel} for loglevel, level_list in level_items for pkg in level_list}
+    )
 
     if log_filepath:
         # Not possible to add a default filepath because it would always create this file,
@@ -94,6 +119,48 @@ def get_logconfig_dict(level_root="WARNING", level_dict=None, log_filepath=None)
     return logconfig_dict
 
 
+# The all-defaults config is by far the most common request (set_default_logconfig
+# at import time); freeze it once so the fast path is just a deepcopy.
+_DEFAULT_LOGCONFIG = _build_logconfig_dict_cached("WARNING", (), None)
+
+
+def get_logconfig_dict(level_root="WARNING", level_dict=None, log_filepath=None):
+    """Make a dict for the logging.
+
+    Parameters
+    ----------
+    level_root : str
+        Default log level, warnings are printed to console.
+    level_dict : dict[level:list]
+        e.g. {"INFO" : ['hhnk_research_tools','hhnk_threedi_tools']}
+        Apply a different loglevel for these packages.
+    log_filepath : str
+        Option to write a log_filepath.
+    """
+    # Fast path for the all-defaults call.
+    if level_root == "WARNING" and not level_dict and not log_filepath:
+        return copy.deepcopy(_DEFAULT_LOGCONFIG)
+
+    # Convert level_dict to a hashable form so the built dict can be cached.
+    level_items = ()
+    if level_dict:
+        for level_list in level_dict.values():
+            if not isinstance(level_list, list):
+                raise TypeError("Level_dict should provide lists.")
+
+        # A package under multiple loglevels would silently get the last one.
+        all_pkgs = [pkg for level_list in level_dict.values() for pkg in level_list]
+        if len(all_pkgs) != len(set(all_pkgs)):
+            duplicates = sorted({pkg for pkg in all_pkgs if all_pkgs.count(pkg) > 1})
+            raise ValueError(f"Packages occur under multiple loglevels in level_dict: {duplicates}")
+
+        level_items = tuple(sorted((loglevel, tuple(pkgs)) for loglevel, pkgs in level_dict.items()))
+
+    cached = _build_logconfig_dict_cached(level_root, level_items, str(log_filepath) if log_filepath else None)
+    # Deepcopy so callers (and dictConfig) cannot mutate the cached template.
+    return copy.deepcopy(cached)
+
+
 def set_default_logconfig(level_root="WARNING", level_dict=None, log_filepath=None):
     """Use this to set the default config, which will log to the console.
 
@@ -116,7 +183,42 @@ def set_default_logconfig(level_root="WARNING", level_dict=None, log_filepath=No
     """
     log_config = get_logconfig_dict(level_root=level_root, level_dict=level_dict, log_filepath=log_filepath)
 
-    logging.config.dictConfig(log_config)
+    logging_config.dictConfig(log_config)
+
+    # dictConfig replaced the handlers, so cached get_logger calls must re-apply
+    # their format configuration on the next call.
+    _get_logger_cached.cache_clear()
+
+
+# Index of filehandlers per (logger, filepath) so add_file_handler can replace
+# an existing handler without scanning logger.handlers on every call.
+_file_handler_index: dict = {}
+
+
+def _drop_logger_from_index(logger_id):
+    """Remove all index entries of a garbage collected logger."""
+    for key in [key for key in _file_handler_index if key[0] == logger_id]:
+        del _file_handler_index[key]
+
+
+def _remove_existing_file_handler(logger, handler):
+    """Remove a handler added by add_file_handler and close it.
+
+    Closing (instead of only removing) flushes a buffered handler now, before the
+    replacement handler reopens the file; the atexit close would otherwise fire
+    after the replacement wrote and truncate it when filemode='w'.
+    """
+    logger.removeHandler(handler)
+    if isinstance(handler, MemoryHandler):
+        file_handler = handler.target
+        atexit.unregister(handler.close)
+        handler.close()  # flushOnClose=True flushes the buffer to the target.
+        if file_handler is not None:
+            file_handler.close()
+    else:
+        handler.close()
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Removed existing FileHandler, logger probably imported multiple times")
 
 
 def add_file_handler(
@@ -130,6 +232,8 @@ def add_file_handler(
     backupCount=5,
     rotate=False,
     logfilter=None,
+    buffered: bool = True,
+    buffer_capacity: int = 512,
 ):
     """Add a filehandler to the logger. Removes the a filehandler when it is already present
 
@@ -143,24 +247,53 @@ def add_file_handler(
         Set a different level for writing than the console logger.
     datefmt : str, default is "%Y-%m-%d %H:%M:%S"
         Dateformat for the filehandler. Can differ from the console logger.
+    buffered : bool, default is True
+        Buffer records in memory and write them to file in batches instead of
+        per record. The buffer is flushed when it holds buffer_capacity records,
+        on any ERROR record and at exit.
+    buffer_capacity : int, default is 512
+        Number of records to buffer before flushing to file.
     """
 
-    # Remove filehandler when already present
-    for handler in logger.handlers:
-        if isinstance(handler, (logging.FileHandler, RotatingFileHandler)):
-            if Path(handler.stream.name) == filepath:
-                logger.removeHandler(handler)
-                logger.debug("Removed existing FileHandler, logger probably imported multiple times")
+    # Absolute path so a relative and absolute spelling of the same file share one index entry.
+    filepath = os.path.abspath(os.fspath(filepath))
+    index_key = (id(logger), filepath)
+
+    # Remove filehandler when already present; O(1) lookup in the index.
+    existing_handler = _file_handler_index.pop(index_key, None)
+    if existing_handler is not None:
+        _remove_existing_file_handler(logger, existing_handler)
+    else:
+        # Fallback scan for handlers added outside of this function or when the index
+        # was lost (e.g. module reload). Buffered handlers are MemoryHandlers wrapping
+        # the filehandler, so match on their target as well. Compare normalized path
+        # strings; baseFilename is already absolute and comparing strings avoids
+        # building two Path objects per handler.
+        target = os.path.normcase(filepath)
+        for handler in list(logger.handlers):
+            file_handler = handler.target if isinstance(handler, MemoryHandler) else handler
+            if isinstance(file_handler, logging.FileHandler):
+                if os.path.normcase(file_handler.baseFilename) == target:
+                    _remove_existing_file_handler(logger, handler)
+                    # Drop index entries still pointing at the removed handler.
+                    for key in [key for key, hdlr in _file_handler_index.items() if hdlr is handler]:
+                        del _file_handler_index[key]
 
     # TODO  add test that filemode is doing the correct thing
+    # delay=True postpones opening the file until the first record is emitted,
+    # so wiring up a logger that never writes costs no I/O or file descriptor.
     if not rotate:
-        file_handler = logging.FileHandler(str(filepath), mode=filemode)
+        file_handler = logging.FileHandler(str(filepath), mode=filemode, delay=True)
     else:
         # TODO filemode 'w' doesnt seem to reset file on RotatingFileHandler
-        file_handler = RotatingFileHandler(str(filepath), mode=filemode, maxBytes=maxBytes, backupCount=backupCount)
-
-    # This formatter includes longdate.
-    formatter = logging.Formatter(fmt=fmt, datefmt=datefmt)
+        file_handler = RotatingFileHandler(
+            str(filepath), mode=filemode, maxBytes=maxBytes, backupCount=backupCount, delay=True
+        )
+
+    # This formatter includes longdate. Only the default LOGFORMAT needs the
+    # padding FastFormatter restores; custom formats get a plain Formatter.
+    formatter_cls = FastFormatter if fmt == LOGFORMAT else logging.Formatter
+    formatter = formatter_cls(fmt=fmt, datefmt=datefmt)
     file_handler.setFormatter(formatter)
 
     # Set level of filehandler, can be different from logger.
@@ -170,10 +303,51 @@ def add_file_handler(
 
     if logfilter:
         file_handler.addFilter(logfilter)
-        logger.debug("Added filter to FileHandler")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Added filter to FileHandler")
+
+    if buffered:
+        # Batch writes in memory; every record would otherwise trigger a
+        # stream.write + flush (and a size check when rotating).
+        memory_handler = MemoryHandler(
+            buffer_capacity,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True,
+        )
+        memory_handler.setLevel(file_handler.level)
+        if logfilter:
+            memory_handler.addFilter(logfilter)
+        atexit.register(memory_handler.close)  # Guarantee the buffer is flushed at exit.
+        file_handler = memory_handler
 
     logger.addHandler(file_handler)
 
+    # Index the handler and clean up when the logger is garbage collected.
+    _file_handler_index[index_key] = file_handler
+    weakref.finalize(logger, _drop_logger_from_index, id(logger))
+
+
+# Reuse Formatter instances per (fmt, datefmt) so repeated calls can compare
+# by identity instead of constructing a new Formatter every time.
+_FORMATTER_CACHE: dict = {}
+
+# Serialize the check-then-add of StreamHandlers; concurrent imports could
+# otherwise attach the same handler twice.
+_STDOUT_HANDLER_LOCK = threading.Lock()
+
+
+def _get_formatter(fmt, datefmt) -> logging.Formatter:
+    """Return a shared Formatter for this (fmt, datefmt) combination."""
+    key = (fmt, datefmt)
+    formatter = _FORMATTER_CACHE.get(key)
+    if formatter is None:
+        # Only the default LOGFORMAT relies on FastFormatter's levelname padding;
+        # custom formats keep the plain Formatter behavior.
+        formatter_cls = FastFormatter if fmt == LOGFORMAT else logging.Formatter
+        formatter = _FORMATTER_CACHE.setdefault(key, formatter_cls(fmt=fmt, datefmt=datefmt))
+    return formatter
+
 
 def _add_or_update_streamhandler_format(logger, fmt, datefmt, propagate: bool = True):
     """Add a StreamHandler with the given formatter to the logger.
@@ -192,24 +366,69 @@ def _add_or_update_streamhandler_format(logger, fmt, datefmt, propagate: bool =
     else:
         logger.propagate = False
 
-    handler_updated = False
-    # Check if the logger already has a StreamHandler with the correct formatter
-    for handler in logger.handlers:
-        if isinstance(handler, logging.StreamHandler):
-            # Update the formatter if the StreamHandler is found
-            handler.setFormatter(logging.Formatter(fmt=fmt, datefmt=datefmt))
-            logger.debug("Updated StreamHandler formatter")
+    formatter = _get_formatter(fmt, datefmt)
+
+    with _STDOUT_HANDLER_LOCK:
+        handler_updated = False
+        # Check if the logger already has a StreamHandler with the correct formatter
+        for handler in logger.handlers:
+            if isinstance(handler, logging.StreamHandler):
+                # Update the formatter if the StreamHandler is found, skip when it already
+                # carries the shared instance or an equivalent one (e.g. set via dictConfig).
+                current = handler.formatter
+                if current is not formatter and not (
+                    current is not None and current._fmt == fmt and current.datefmt == datefmt
+                ):
+                    handler.setFormatter(formatter)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Updated StreamHandler formatter")
+
+                handler_updated = True
+
+        if handler_updated:
+            return
+
+        # If no matching StreamHandler was found, add a new one
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(formatter)
+        logger.addHandler(stream_handler)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Added new StreamHandler with formatter")
+
+
+# Registry of loggers per name; logging.getLogger takes the global logging._lock,
+# which is a contention point in threaded jobs. A repeat lookup here skips it.
+_LOGGER_CACHE: dict = {}
+_LOGGER_CACHE_LOCK = threading.Lock()
+
+
+def _get_cached_logger(name) -> logging.Logger:
+    """Return the logger for this name, bypassing logging._lock on repeat calls."""
+    logger = _LOGGER_CACHE.get(name)
+    if logger is None:
+        # Race on insert is benign; logging.getLogger returns the same instance.
+        logger = logging.getLogger(name)
+        with _LOGGER_CACHE_LOCK:
+            _LOGGER_CACHE[name] = logger
+    return logger
 
-            handler_updated = True
 
-    if handler_updated:
-        return
+@functools.lru_cache(maxsize=1024)
+def _get_logger_cached(name, fmt, datefmt, propagate) -> logging.Logger:
+    """Configure and return the logger, cached on its arguments.
 
-    # If no matching StreamHandler was found, add a new one
-    stream_handler = logging.StreamHandler(sys.stdout)
-    stream_handler.setFormatter(logging.Formatter(fmt=fmt, datefmt=datefmt))
-    logger.addHandler(stream_handler)
-    logger.debug("Added new StreamHandler with formatter")
+    get_logger is called with name=__name__ from many modules; repeat calls
+    with the same arguments skip the format re-configuration entirely.
+    set_default_logconfig clears this cache because dictConfig replaces the
+    handlers the cached calls configured.
+    """
+    logger = _get_cached_logger(name)
+
+    # Change log format or datefmt
+    if (fmt != LOGFORMAT) or (datefmt != DATEFMT_STREAM):
+        _add_or_update_streamhandler_format(logger, fmt=fmt, datefmt=datefmt, propagate=propagate)
+
+    return logger
 
 
 def get_logger(name: str, level=None, fmt=LOGFORMAT, datefmt: str = DATEFMT_STREAM, propagate=True) -> logging.Logger:
@@ -237,24 +456,14 @@ def get_logger(name: str, level=None, fmt=LOGFORMAT, datefmt: str = DATEFMT_STRE
         Change the default dateformatter to e.g. "%Y-%m-%d %H:%M:%S"
     """
     # Rename long names with shorter ones
-    replacements = {
-        "hhnk_research_tools": "hrt",
-        "hhnk_threedi_tools": "htt",
-    }
-
-    for old, new in replacements.items():
-        name = name.replace(old, new)
+    name = _NAME_PATTERN.sub(lambda m: _NAME_MAP[m.group(0)], name)
 
-    logger = logging.getLogger(name)
+    logger = _get_logger_cached(name, fmt, datefmt, propagate)
 
-    # Change log level
+    # Change log level; outside the cached body so every call applies it.
     if level is not None:
         logger.setLevel(level)
 
-    # Change log format or datefmt
-    if (fmt != LOGFORMAT) or (datefmt != DATEFMT_STREAM):
-        _add_or_update_streamhandler_format(logger, fmt=fmt, datefmt=datefmt, propagate=propagate)
-
     return logger
 
 
@@ -0,0 +1,84 @@
+# %%
+import logging
+
+import pytest
+
+import hhnk_research_tools as hrt
+import hhnk_research_tools.logger as hrt_logging
+from tests_hrt.config import TEMP_DIR
+
+
+def _get_test_logger(level=logging.INFO):
+    """Fresh logger without handlers so tests dont interfere."""
+    logger = logging.getLogger(f"test_logger_{hrt.get_uuid()}")
+    logger.setLevel(level)
+    logger.propagate = False
+    return logger
+
+
+def test_get_logconfig_dict_validation():
+    # level_dict values must be lists
+    with pytest.raises(TypeError):
+        hrt_logging.get_logconfig_dict(level_dict={"INFO": "hhnk_research_tools"})
+
+    # A package under multiple loglevels should not be silently overwritten
+    with pytest.raises(ValueError):
+        hrt_logging.get_logconfig_dict(level_dict={"INFO": ["pkg"], "DEBUG": ["pkg"]})
+
+
+def test_add_file_handler_buffered():
+    logger = _get_test_logger()
+    filepath = TEMP_DIR / f"buffered_{hrt.get_uuid()}.log"
+
+    hrt_logging.add_file_handler(logger=logger, filepath=filepath)
+
+    # delay=True; the file is only created on the first flush
+    logger.info("buffered message")
+    assert not filepath.exists()
+
+    # An ERROR record flushes the buffer to file
+    logger.error("error flushes")
+    log_text = filepath.read_text()
+    assert "buffered message" in log_text
+    assert "error flushes" in log_text
+
+    # Closing flushes the remaining buffer
+    logger.info("flushed on close")
+    handler = logger.handlers[0]
+    logger.removeHandler(handler)
+    handler.close()
+    assert "flushed on close" in filepath.read_text()
+
+
+def test_add_file_handler_no_duplicates_no_loss():
+    logger = _get_test_logger()
+    filepath = TEMP_DIR / f"dedup_{hrt.get_uuid()}.log"
+
+    hrt_logging.add_file_handler(logger=logger, filepath=filepath)
+    logger.info("first session")
+
+    # Re-calling replaces the handler instead of adding a second one
+    hrt_logging.add_file_handler(logger=logger, filepath=filepath)
+    assert len(logger.handlers) == 1
+
+    # The replaced handler was flushed, not dropped
+    assert "first session" in filepath.read_text()
+
+    # Same when the index is lost, e.g. after a module reload; the fallback
+    # scan should still find the (buffered) handler
+    hrt_logging._file_handler_index.clear()
+    hrt_logging.add_file_handler(logger=logger, filepath=filepath)
+    assert len(logger.handlers) == 1
+
+    logger.info("second session")
+    handler = logger.handlers[0]
+    logger.removeHandler(handler)
+    handler.close()
+    assert "second session" in filepath.read_text()
+
+
+# %%
+if __name__ == "__main__":
+    test_get_logconfig_dict_validation()
+    test_add_file_handler_buffered()
+    test_add_file_handler_no_duplicates_no_loss()